@@ -0,0 +1,144 @@
+"""Profile the import time of the Flamerite integration modules.
+
+Each module is imported in a fresh interpreter with ``-X importtime`` after
+preloading the modules that are always loaded by the time the integration is
+set up: the Home Assistant core, the ``bluetooth`` component (set up for the
+manifest's ``bluetooth`` matcher and ``bluetooth_adapters`` dependency) and
+the ``flamerite_bt`` requirement. This isolates the cost attributable to the
+integration itself (including any Home Assistant components pulled in by a
+platform).
+
+See ``setup_time.py`` for the cost of setting up a config entry.
+
+Run from the repository root:
+
+    poetry run python benchmarks/import_time.py --repeat 7 \
+        --output benchmarks/results/import_time.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import re
+import statistics
+import subprocess  # nosec B404
+import sys
+from importlib.metadata import version
+from pathlib import Path
+
+PACKAGE = "custom_components.flamerite"
+MODULES = [
+    "",
+    "coordinator",
+    "entity",
+    "config_flow",
+    "services",
+    "switch",
+    "climate",
+    "select",
+    "number",
+    "sensor",
+]
+
+# Modules that Home Assistant has already imported before the integration
+# is set up.
+PRELOAD = [
+    "homeassistant.core",
+    "homeassistant.config_entries",
+    "homeassistant.helpers.entity_platform",
+    "homeassistant.helpers.update_coordinator",
+    "homeassistant.helpers.storage",
+    "homeassistant.components.bluetooth",
+    "flamerite_bt.device",
+]
+
+# Written to stderr between the preload and the target import so that the
+# -X importtime output can be split unambiguously.
+SENTINEL = "--- flamerite benchmark: preload done ---"
+
+IMPORTTIME_RE = re.compile(
+    r"^import time:\s+(?P<self>\d+)\s+\|\s+(?P<cumulative>\d+)\s+\|"
+    r"(?P<indent>\s+)(?P<module>\S+)$"
+)
+
+
+def profile_module(repo_root: Path, module: str) -> dict[str, float]:
+    """Import a module in a fresh interpreter and return its timings in ms."""
+    preload = "; ".join(f"import {mod}" for mod in PRELOAD)
+    proc = subprocess.run(  # nosec B603
+        [
+            sys.executable,
+            "-X",
+            "importtime",
+            "-c",
+            f"{preload}; import sys; "
+            f"sys.stderr.write({SENTINEL!r} + '\\n'); sys.stderr.flush(); "
+            f"import {module}",
+        ],
+        cwd=repo_root,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    # Only lines emitted after the preload has completed are attributed to
+    # the target module.
+    lines = proc.stderr.splitlines()
+    start = lines.index(SENTINEL) + 1
+    lines = lines[start:]
+
+    total_us = 0
+    target_us = 0
+    for line in lines:
+        if not (match := IMPORTTIME_RE.match(line)):
+            continue
+        total_us += int(match["self"])
+        if match["module"] == module:
+            target_us = int(match["cumulative"])
+
+    return {"cumulative_ms": target_us / 1000, "total_ms": total_us / 1000}
+
+
+def main() -> None:
+    """Run the benchmark and print (or store) the results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--repeat", type=int, default=5, help="runs per module (median)"
+    )
+    parser.add_argument("--output", type=Path, help="write JSON results here")
+    args = parser.parse_args()
+
+    repo_root = Path(__file__).resolve().parent.parent
+    results: dict[str, dict[str, float]] = {}
+    for name in MODULES:
+        module = f"{PACKAGE}.{name}" if name else PACKAGE
+        runs = [profile_module(repo_root, module) for _ in range(args.repeat)]
+        results[module] = {
+            key: statistics.median(run[key] for run in runs) for key in runs[0]
+        }
+        print(
+            f"{module:<40} {results[module]['cumulative_ms']:>10.2f} ms "
+            f"(all new imports: {results[module]['total_ms']:.2f} ms)"
+        )
+
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(
+            json.dumps(
+                {
+                    "python": platform.python_version(),
+                    "homeassistant": version("homeassistant"),
+                    "flamerite_bt": version("flamerite-bt"),
+                    "repeat": args.repeat,
+                    "modules": results,
+                },
+                indent=2,
+            )
+            + "\n"
+        )
+
+
+if __name__ == "__main__":
+    main()
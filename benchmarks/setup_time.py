@@ -0,0 +1,130 @@
+"""Profile the set up time of a Flamerite config entry.
+
+Each run sets up a config entry through the real integration and platforms
+in a fresh Home Assistant instance, backed by the fake device from the soak
+harness. The integration modules are imported and the entity components set
+up before timing starts; their cost is covered by ``import_time.py`` or is
+shared with every other integration. The event loop runs on the soak
+harness's virtual clock, so the simulated Bluetooth latency of the fake
+device is not counted and the results reflect the work done by the
+integration and Home Assistant.
+
+Run from the repository root:
+
+    poetry run python -m benchmarks.setup_time --repeat 7 \
+        --output benchmarks/results/setup_time.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import importlib
+import json
+import logging
+import platform
+import statistics
+import tempfile
+import time
+from importlib.metadata import version
+from pathlib import Path
+
+from homeassistant.core import CoreState
+from homeassistant.setup import (
+    async_get_domain_setup_times,
+    async_setup_component,
+)
+
+from custom_components.flamerite.const import DOMAIN, PLATFORMS
+
+from .soak import (
+    FakeDevice,
+    VirtualClockEventLoop,
+    async_setup_flamerite,
+    async_start_hass,
+)
+
+
+async def profile_setup(config_dir: str) -> dict[str, float]:
+    """Set up a config entry and return the time spent per phase in ms."""
+    hass = await async_start_hass(config_dir)
+    for domain in PLATFORMS:
+        await async_setup_component(hass, domain, {})
+
+    # Home Assistant only records setup phase timings while starting up.
+    hass.set_state(CoreState.starting)
+
+    device = FakeDevice(slow_write_seconds=0)
+    start = time.perf_counter()
+    entry = await async_setup_flamerite(hass, device, {})
+    timings = {"total": (time.perf_counter() - start) * 1000}
+
+    # Phases are recorded per group (the component itself or the config
+    # entry); sum each phase across groups. Time spent waiting on other
+    # work, such as platform imports, is recorded as a negative value.
+    for phases in async_get_domain_setup_times(hass, DOMAIN).values():
+        for phase, seconds in phases.items():
+            timings[phase] = timings.get(phase, 0.0) + seconds * 1000
+
+    await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_stop(force=True)
+    return timings
+
+
+def run_once() -> dict[str, float]:
+    """Run a single profile in a fresh event loop and config directory."""
+    loop = VirtualClockEventLoop()
+    asyncio.set_event_loop(loop)
+    try:
+        with tempfile.TemporaryDirectory() as config_dir:
+            return loop.run_until_complete(profile_setup(config_dir))
+    finally:
+        loop.close()
+
+
+def main() -> None:
+    """Run the benchmark and print (or store) the results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--repeat", type=int, default=5, help="runs to take the median of"
+    )
+    parser.add_argument("--output", type=Path, help="write JSON results here")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.CRITICAL)
+    for name in ("", *(f".{domain}" for domain in PLATFORMS)):
+        importlib.import_module(f"custom_components.flamerite{name}")
+
+    # The first run pays for one-off work such as loading translations
+    # from disk, so report it separately from the median of the rest.
+    runs = [run_once() for _ in range(args.repeat + 1)]
+    first, warm = runs[0], runs[1:]
+    results = {
+        "first_run_ms": first,
+        "median_ms": {
+            key: statistics.median(run.get(key, 0.0) for run in warm)
+            for key in first
+        },
+    }
+    for key, value in results["median_ms"].items():
+        print(f"{key:<40} {value:>10.2f} ms (first run: {first[key]:.2f} ms)")
+
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(
+            json.dumps(
+                {
+                    "python": platform.python_version(),
+                    "homeassistant": version("homeassistant"),
+                    "flamerite_bt": version("flamerite-bt"),
+                    "repeat": args.repeat,
+                    **results,
+                },
+                indent=2,
+            )
+            + "\n"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,695 @@
+"""Fault-injection soak harness for the Flamerite integration.
+
+Sets a config entry up through the real integration and platforms, with
+the Bluetooth device replaced by a fake one, and drives it through several
+simulated days with service calls and a simulated room temperature sensor.
+The event loop runs on a virtual clock, so timers fire as soon as the loop
+would otherwise go idle and a multi-day soak completes in minutes of
+wall-clock time.
+
+Faults are injected on a fixed schedule, cycling through the classes below:
+
+- ``connect_failure``: the link drops and reconnect attempts fail.
+- ``link_drop``: the link drops once; reconnecting succeeds.
+- ``query_timeout``: state queries time out without a response.
+- ``slow_write``: every command takes several seconds to complete.
+
+The harness checks that memory and task count stay bounded and that the
+coordinator recovers within a bounded time after each fault. The report it
+writes can be compared between releases.
+
+Run from the repository root:
+
+    poetry run python -m benchmarks.soak --days 3 \
+        --output benchmarks/results/soak.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import random
+import selectors
+import statistics
+import sys
+import tempfile
+import threading
+import tracemalloc
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any
+from unittest.mock import patch
+
+from bleak.exc import BleakError
+from flamerite_bt.const import (
+    DEVICE_RESPONSE_TIMEOUT_SECONDS,
+    Color,
+    HeatMode,
+)
+from flamerite_bt.state import State
+from homeassistant import bootstrap, loader
+from homeassistant.components import bluetooth
+from homeassistant.components.climate.const import (
+    FAN_HIGH,
+    FAN_LOW,
+    FAN_OFF,
+    HVACMode,
+)
+from homeassistant.config_entries import (
+    ConfigEntries,
+    ConfigEntry,
+    ConfigEntryState,
+)
+from homeassistant.const import (
+    ATTR_ENTITY_ID,
+    ATTR_UNIT_OF_MEASUREMENT,
+    CONF_ADDRESS,
+    EVENT_STATE_CHANGED,
+    UnitOfTemperature,
+)
+from homeassistant.core import CoreState, HomeAssistant
+from homeassistant.helpers import entity_registry as er
+
+from custom_components.flamerite.const import CONF_TEMPERATURE_SENSOR, DOMAIN
+from custom_components.flamerite.select import COLOR_NAME_MAP
+
+TEMPERATURE_SENSOR = "sensor.soak_room_temperature"
+
+FAULT_CLASSES = ["connect_failure", "link_drop", "query_timeout", "slow_write"]
+
+SECONDS_PER_MINUTE = 60
+SECONDS_PER_HOUR = 3600
+SECONDS_PER_DAY = 86400
+
+
+class VirtualClockSelector(selectors.BaseSelector):
+    """A selector which advances a virtual clock instead of blocking."""
+
+    def __init__(self) -> None:
+        """Initialize the selector."""
+        self._selector = selectors.DefaultSelector()
+        self.loop: VirtualClockEventLoop
+
+    def select(self, timeout: float | None = None):
+        """Return ready events, advancing the virtual clock when idle."""
+        events = self._selector.select(0)
+        if events or timeout == 0:
+            return events
+
+        # Executor jobs complete on real threads; wait for them for real so
+        # the virtual clock does not race ahead of blocking I/O.
+        if timeout is None or self.loop.executor_jobs:
+            return self._selector.select(timeout)
+
+        self.loop.now += timeout
+        return []
+
+    def register(self, fileobj, events, data=None):
+        """Register a file object."""
+        return self._selector.register(fileobj, events, data)
+
+    def unregister(self, fileobj):
+        """Unregister a file object."""
+        return self._selector.unregister(fileobj)
+
+    def modify(self, fileobj, events, data=None):
+        """Change a registered file object monitored events or data."""
+        return self._selector.modify(fileobj, events, data)
+
+    def close(self) -> None:
+        """Close the selector."""
+        self._selector.close()
+
+    def get_map(self):
+        """Return a mapping of file objects to selector keys."""
+        return self._selector.get_map()
+
+
+class VirtualClockEventLoop(asyncio.SelectorEventLoop):
+    """An event loop whose clock only advances while it is idle."""
+
+    def __init__(self) -> None:
+        """Initialize the event loop."""
+        selector = VirtualClockSelector()
+        super().__init__(selector)
+        selector.loop = self
+        self.now = 0.0
+        self.executor_jobs = 0
+
+    def time(self) -> float:
+        """Return the virtual time."""
+        return self.now
+
+    def run_in_executor(self, executor, func, *args):
+        """Run a function in the executor and track it while in flight."""
+        self.executor_jobs += 1
+        future = super().run_in_executor(executor, func, *args)
+        future.add_done_callback(self._executor_job_done)
+        return future
+
+    def _executor_job_done(self, _future: asyncio.Future) -> None:
+        self.executor_jobs -= 1
+
+
+@dataclass
+class FaultWindow:
+    """A fault injected into the fake device for a period of time."""
+
+    fault: str
+    start: float
+    end: float
+    recovered_at: float | None = None
+
+    @property
+    def recovery_seconds(self) -> float | None:
+        """Return the time taken to recover after the fault was cleared."""
+        if self.recovered_at is None:
+            return None
+        return self.recovered_at - self.end
+
+
+class FakeDevice:
+    """A stand-in for flamerite_bt.device.Device with injectable faults."""
+
+    def __init__(self, slow_write_seconds: float) -> None:
+        """Initialize the fake device."""
+        self._state = State()
+        self._lock = asyncio.Lock()
+        self._is_connected = False
+        self._slow_write_seconds = slow_write_seconds
+        self.fault: str | None = None
+        self.last_response_at = 0.0
+        self.connects = 0
+        self.commands = 0
+        self.queries = 0
+        self.failed_queries = 0
+        self.timed_out_queries = 0
+
+    async def connect(self, retry_attempts=4) -> None:
+        """Connect to the device."""
+        if self._is_connected:
+            return
+        await asyncio.sleep(0.5 * retry_attempts)
+        if self.fault == "connect_failure":
+            return
+        self._is_connected = True
+        self.connects += 1
+
+    async def disconnect(self) -> None:
+        """Disconnect the device."""
+        self._is_connected = False
+
+    def drop_link(self) -> None:
+        """Simulate the device going out of range."""
+        self._is_connected = False
+
+    async def query_state(self) -> None:
+        """Query the device state."""
+        if not self._is_connected:
+            await self.connect(retry_attempts=1)
+
+        async with self._lock:
+            self.queries += 1
+            try:
+                await self._send_cmd()
+            except BleakError:
+                self.failed_queries += 1
+                raise
+            if self.fault == "query_timeout":
+                # Mirror the library, which logs and returns on timeout.
+                self.timed_out_queries += 1
+                await asyncio.sleep(DEVICE_RESPONSE_TIMEOUT_SECONDS)
+                return
+            await asyncio.sleep(0.2)
+            self.last_response_at = asyncio.get_running_loop().time()
+
+    async def _send_cmd(self) -> None:
+        if not self._is_connected:
+            raise BleakError("Not connected")
+        self.commands += 1
+        if self.fault == "slow_write":
+            await asyncio.sleep(self._slow_write_seconds)
+        else:
+            await asyncio.sleep(0.05)
+
+    async def _set(self, attr: str, value: Any) -> None:
+        if not self._is_connected:
+            await self.connect(retry_attempts=1)
+        async with self._lock:
+            if getattr(self._state, attr) == value:
+                return
+            setattr(self._state, attr, value)
+            await self._send_cmd()
+
+    @property
+    def is_connected(self) -> bool:
+        """Return true if the device is connected."""
+        return self._is_connected
+
+    name = "NITRAFlame"
+    mac = "00:00:00:00:00:00"
+    model_number = "soak"
+    serial_number = "soak-0001"
+    manufacturer = "Flamerite"
+    firmware_revision = "0"
+    hardware_revision = "0"
+
+    @property
+    def is_powered_on(self) -> bool:
+        """Return true if the device is powered on."""
+        return self._state.is_powered_on
+
+    async def set_powered_on(self, value: bool) -> None:
+        """Set the device power state."""
+        await self._set("is_powered_on", value)
+
+    @property
+    def heat_mode(self) -> HeatMode:
+        """Return the current heat mode."""
+        return self._state.heat_mode
+
+    async def set_heat_mode(self, mode: HeatMode) -> None:
+        """Set the heat mode."""
+        # Like the library, refuse to heat while the device is powered off.
+        if not self._state.is_powered_on and mode is not HeatMode.OFF:
+            return
+        await self._set("heat_mode", mode)
+
+    @property
+    def thermostat(self) -> int:
+        """Return the current thermostat temperature."""
+        return self._state.thermostat
+
+    async def set_thermostat(self, temperature: int) -> None:
+        """Set the thermostat temperature."""
+        await self._set("thermostat", temperature)
+
+    @property
+    def flame_color(self) -> Color:
+        """Return the current flame color."""
+        return self._state.flame_color
+
+    async def set_flame_color(self, color: Color) -> None:
+        """Set the flame color."""
+        await self._set("flame_color", color)
+
+    @property
+    def fuel_color(self) -> Color:
+        """Return the current fuel color."""
+        return self._state.fuel_color
+
+    async def set_fuel_color(self, color: Color) -> None:
+        """Set the fuel color."""
+        await self._set("fuel_color", color)
+
+    @property
+    def flame_brightness(self) -> int:
+        """Return the current flame brightness level."""
+        return self._state.flame_brightness
+
+    async def set_flame_brightness(self, brightness: int) -> None:
+        """Set the flame brightness level."""
+        await self._set("flame_brightness", brightness)
+
+    @property
+    def fuel_brightness(self) -> int:
+        """Return the current fuel brightness level."""
+        return self._state.fuel_brightness
+
+    async def set_fuel_brightness(self, brightness: int) -> None:
+        """Set the fuel brightness level."""
+        await self._set("fuel_brightness", brightness)
+
+
+@dataclass
+class SoakResult:
+    """Measurements collected during a soak run."""
+
+    faults: list[FaultWindow] = field(default_factory=list)
+    memory_kib: list[float] = field(default_factory=list)
+    task_counts: list[int] = field(default_factory=list)
+    actions: int = 0
+    failed_actions: int = 0
+    state_changes: int = 0
+    controller_writes: int = 0
+    controller_saved_writes: int = 0
+    connects: int = 0
+    commands: int = 0
+    queries: int = 0
+    failed_queries: int = 0
+    timed_out_queries: int = 0
+
+
+async def async_start_hass(config_dir: str) -> HomeAssistant:
+    """Start a minimal Home Assistant instance for the benchmarks."""
+    loop = asyncio.get_running_loop()
+
+    # Mirror what the Home Assistant runner and bootstrap do before any
+    # integration is set up.
+    setattr(loop, "_thread_ident", threading.get_ident())
+    hass = HomeAssistant(config_dir)
+    hass.loop_thread_id = threading.get_ident()
+    hass.config.skip_pip = True
+    loader.async_setup(hass)
+    hass.config_entries = ConfigEntries(hass, {})
+    await bootstrap.async_load_base_functionality(hass)
+
+    # The Bluetooth stack is never used as the device is faked.
+    hass.config.components.add("bluetooth_adapters")
+    hass.set_state(CoreState.running)
+    return hass
+
+
+async def async_setup_flamerite(
+    hass: HomeAssistant, device: FakeDevice, options: dict[str, Any]
+) -> ConfigEntry:
+    """Set up a Flamerite config entry backed by the fake device."""
+    entry = ConfigEntry(
+        version=1,
+        minor_version=1,
+        domain=DOMAIN,
+        title="soak",
+        data={CONF_ADDRESS: FakeDevice.mac},
+        options=options,
+        source="user",
+        unique_id=None,
+        discovery_keys=MappingProxyType({}),
+        subentries_data=None,
+    )
+    with (
+        patch.object(
+            bluetooth, "async_ble_device_from_address", return_value=object()
+        ),
+        patch("custom_components.flamerite.Device", return_value=device),
+    ):
+        await hass.config_entries.async_add(entry)
+        await hass.async_block_till_done()
+
+    if entry.state is not ConfigEntryState.LOADED:
+        raise RuntimeError(f"Config entry setup failed: {entry.state}")
+    return entry
+
+
+async def run_soak(args: argparse.Namespace, config_dir: str) -> SoakResult:
+    """Drive the integration through the simulated soak."""
+    loop = asyncio.get_running_loop()
+    rng = random.Random(args.seed)
+    result = SoakResult()
+
+    hass = await async_start_hass(config_dir)
+    room_temperature = 20.0
+
+    def _report_room_temperature() -> None:
+        hass.states.async_set(
+            TEMPERATURE_SENSOR,
+            f"{room_temperature:.1f}",
+            {ATTR_UNIT_OF_MEASUREMENT: UnitOfTemperature.CELSIUS},
+        )
+
+    _report_room_temperature()
+
+    device = FakeDevice(args.slow_write_seconds)
+    entry = await async_setup_flamerite(
+        hass, device, {CONF_TEMPERATURE_SENSOR: TEMPERATURE_SENSOR}
+    )
+    coordinator = entry.runtime_data
+    entity_ids = {
+        reg_entry.unique_id.removeprefix(f"{device.serial_number}_"): (
+            reg_entry.entity_id
+        )
+        for reg_entry in er.async_entries_for_config_entry(
+            er.async_get(hass), entry.entry_id
+        )
+    }
+
+    def _on_state_changed(event) -> None:
+        if event.data["entity_id"] in entity_ids.values():
+            result.state_changes += 1
+
+    unsub_state_changed = hass.bus.async_listen(
+        EVENT_STATE_CHANGED, _on_state_changed
+    )
+
+    active: list[FaultWindow] = []
+
+    def _on_update() -> None:
+        # Listeners are notified after every successful poll, but only once
+        # when polls start failing, so failures are counted by the device.
+        if not coordinator.last_update_success or not device.is_connected:
+            return
+        for window in active:
+            if (
+                window.recovered_at is None
+                and loop.time() >= window.end
+                and device.last_response_at >= window.end
+            ):
+                window.recovered_at = loop.time()
+
+    unsub = coordinator.async_add_listener(_on_update)
+
+    def _call(domain: str, service: str, key: str, **data: Any):
+        return hass.services.async_call(
+            domain,
+            service,
+            {ATTR_ENTITY_ID: entity_ids[key], **data},
+            blocking=True,
+        )
+
+    color_names = list(COLOR_NAME_MAP)
+    actions = [
+        lambda: _call(
+            "climate",
+            "set_hvac_mode",
+            "heater",
+            hvac_mode=rng.choice([HVACMode.HEAT, HVACMode.OFF]),
+        ),
+        lambda: _call(
+            "climate",
+            "set_temperature",
+            "heater",
+            temperature=rng.randint(18, 23),
+        ),
+        lambda: _call(
+            "climate",
+            "set_fan_mode",
+            "heater",
+            fan_mode=rng.choice([FAN_OFF, FAN_LOW, FAN_HIGH]),
+        ),
+        lambda: _call(
+            "switch", rng.choice(["turn_on", "turn_off"]), "power_state"
+        ),
+        lambda: _call(
+            "number",
+            "set_value",
+            rng.choice(["flame_brightness", "fuel_brightness"]),
+            value=rng.randint(1, 10),
+        ),
+        lambda: _call(
+            "select",
+            "select_option",
+            rng.choice(["flame_leds", "fuel_leds"]),
+            option=rng.choice(color_names),
+        ),
+    ]
+
+    pending: set[asyncio.Task] = set()
+
+    async def _run_action(action) -> None:
+        result.actions += 1
+        try:
+            await action()
+        except Exception:
+            result.failed_actions += 1
+
+    tracemalloc.start()
+    start = loop.time()
+    end = start + args.days * SECONDS_PER_DAY
+    next_fault = start + args.fault_interval_hours * SECONDS_PER_HOUR
+    next_sample = start
+    current: FaultWindow | None = None
+
+    while (now := loop.time()) < end:
+        # Clear or inject faults.
+        if current and now >= current.end:
+            device.fault = None
+            current = None
+        if current is None and now >= next_fault:
+            fault = FAULT_CLASSES[len(result.faults) % len(FAULT_CLASSES)]
+            current = FaultWindow(
+                fault, now, now + args.fault_minutes * SECONDS_PER_MINUTE
+            )
+            active.append(current)
+            result.faults.append(current)
+            if fault in ("connect_failure", "link_drop"):
+                device.drop_link()
+            if fault != "link_drop":
+                device.fault = fault
+            next_fault += args.fault_interval_hours * SECONDS_PER_HOUR
+
+        # Let the room warm up while the fireplace heats and cool otherwise.
+        heating = device.is_powered_on and device.heat_mode is not HeatMode.OFF
+        room_temperature += (0.05 if heating else -0.03) + rng.uniform(
+            -0.02, 0.02
+        )
+        room_temperature = min(max(room_temperature, 10.0), 30.0)
+        _report_room_temperature()
+
+        # Issue a user action through one of the entities.
+        if rng.random() < args.action_probability:
+            task = loop.create_task(_run_action(rng.choice(actions)))
+            pending.add(task)
+            task.add_done_callback(pending.discard)
+
+        # Sample memory and tasks once per simulated hour.
+        if now >= next_sample:
+            next_sample += SECONDS_PER_HOUR
+            await hass.async_block_till_done()
+            traced, _peak = tracemalloc.get_traced_memory()
+            result.memory_kib.append(traced / 1024)
+            result.task_counts.append(len(asyncio.all_tasks(loop)))
+
+        active = [w for w in active if w.recovered_at is None]
+        await asyncio.sleep(SECONDS_PER_MINUTE)
+
+    tracemalloc.stop()
+    result.connects = device.connects
+    result.commands = device.commands
+    result.queries = device.queries
+    result.failed_queries = device.failed_queries
+    result.timed_out_queries = device.timed_out_queries
+    if (climate := hass.states.get(entity_ids["heater"])) is not None:
+        result.controller_writes = climate.attributes["controller_writes"]
+        result.controller_saved_writes = climate.attributes[
+            "controller_saved_writes"
+        ]
+    unsub()
+    unsub_state_changed()
+    if pending:
+        await asyncio.gather(*pending)
+    await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_stop(force=True)
+    return result
+
+
+def build_report(
+    args: argparse.Namespace, result: SoakResult
+) -> dict[str, Any]:
+    """Summarize the soak measurements and evaluate the checks."""
+    faults: dict[str, dict[str, Any]] = {}
+    for fault in FAULT_CLASSES:
+        windows = [w for w in result.faults if w.fault == fault]
+        recoveries = [
+            w.recovery_seconds
+            for w in windows
+            if w.recovery_seconds is not None
+        ]
+        faults[fault] = {
+            "injected": len(windows),
+            "recovered": len(recoveries),
+            "recovery_seconds_median": (
+                statistics.median(recoveries) if recoveries else None
+            ),
+            "recovery_seconds_max": max(recoveries) if recoveries else None,
+        }
+
+    # Ignore the first quarter of the run while caches warm up, then compare
+    # the second quarter against the final quarter.
+    quarter = max(1, len(result.memory_kib) // 4)
+    half = 2 * quarter
+    early_memory = result.memory_kib[quarter:half]
+    late_memory = result.memory_kib[-quarter:]
+    memory_growth_kib = max(late_memory) - max(early_memory or late_memory)
+    early_tasks = result.task_counts[quarter:half]
+    late_tasks = result.task_counts[-quarter:]
+    task_growth = max(late_tasks) - max(early_tasks or late_tasks)
+
+    checks = {
+        "memory_bounded": memory_growth_kib <= args.max_memory_growth_kib,
+        "tasks_bounded": task_growth <= args.max_task_growth,
+        "all_faults_recovered": all(
+            f["recovered"] == f["injected"] for f in faults.values()
+        ),
+        "recovery_time_bounded": all(
+            f["recovery_seconds_max"] is None
+            or f["recovery_seconds_max"] <= args.max_recovery_seconds
+            for f in faults.values()
+        ),
+    }
+
+    return {
+        "python": sys.version.split()[0],
+        "parameters": {
+            "days": args.days,
+            "seed": args.seed,
+            "fault_interval_hours": args.fault_interval_hours,
+            "fault_minutes": args.fault_minutes,
+            "slow_write_seconds": args.slow_write_seconds,
+        },
+        "connects": result.connects,
+        "commands": result.commands,
+        "queries": result.queries,
+        "failed_queries": result.failed_queries,
+        "timed_out_queries": result.timed_out_queries,
+        "actions": result.actions,
+        "failed_actions": result.failed_actions,
+        "state_changes": result.state_changes,
+        "controller_writes": result.controller_writes,
+        "controller_saved_writes": result.controller_saved_writes,
+        "faults": faults,
+        "memory_kib": {
+            "min": min(result.memory_kib),
+            "max": max(result.memory_kib),
+            "growth": memory_growth_kib,
+        },
+        "tasks": {
+            "min": min(result.task_counts),
+            "max": max(result.task_counts),
+            "growth": task_growth,
+        },
+        "checks": checks,
+        "passed": all(checks.values()),
+    }
+
+
+def main() -> None:
+    """Run the soak and print (or store) the report."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--days", type=float, default=3.0)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--fault-interval-hours", type=float, default=2.0)
+    parser.add_argument("--fault-minutes", type=float, default=5.0)
+    parser.add_argument("--slow-write-seconds", type=float, default=8.0)
+    parser.add_argument("--action-probability", type=float, default=0.2)
+    parser.add_argument("--max-recovery-seconds", type=float, default=120.0)
+    parser.add_argument("--max-memory-growth-kib", type=float, default=512.0)
+    parser.add_argument("--max-task-growth", type=int, default=5)
+    parser.add_argument("--output", type=Path, help="write JSON report here")
+    parser.add_argument("--verbose", action="store_true")
+    args = parser.parse_args()
+
+    # Injected faults make the coordinator log errors on every failed poll.
+    logging.basicConfig(
+        level=logging.INFO if args.verbose else logging.CRITICAL
+    )
+
+    loop = VirtualClockEventLoop()
+    asyncio.set_event_loop(loop)
+    with tempfile.TemporaryDirectory() as config_dir:
+        result = loop.run_until_complete(run_soak(args, config_dir))
+    loop.close()
+
+    report = build_report(args, result)
+    output = json.dumps(report, indent=2)
+    print(output)
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(output + "\n")
+
+    sys.exit(0 if report["passed"] else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -7,9 +7,22 @@ from homeassistant.components import bluetooth
 from homeassistant.const import CONF_ADDRESS
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ConfigEntryNotReady
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.storage import Store
+from homeassistant.helpers.typing import ConfigType
 
-from .const import PLATFORMS
+from .const import DOMAIN, PLATFORMS, USAGE_STORAGE_KEY, USAGE_STORAGE_VERSION
 from .coordinator import FlameriteConfigEntry, FlameriteDataUpdateCoordinator
+from .services import async_setup_services
+
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the Flamerite Fireplace integration."""
+
+    async_setup_services(hass)
+    return True
 
 
 async def async_setup_entry(
@@ -35,17 +48,38 @@ async def async_setup_entry(
 
     # Create and wire the coordinator
     coordinator = FlameriteDataUpdateCoordinator(hass, entry, device)
+    await coordinator.async_load_usage()
     await coordinator.async_config_entry_first_refresh()
 
     entry.runtime_data = coordinator
+    entry.async_on_unload(entry.add_update_listener(_async_update_listener))
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     return True
 
 
+async def _async_update_listener(
+    hass: HomeAssistant, entry: FlameriteConfigEntry
+) -> None:
+    """Reload the config entry when its options change."""
+
+    await hass.config_entries.async_reload(entry.entry_id)
+
+
 async def async_unload_entry(
     hass: HomeAssistant, entry: FlameriteConfigEntry
 ) -> bool:
     """Unload a config entry."""
 
+    await entry.runtime_data.async_save_usage()
     await entry.runtime_data.data.disconnect()
     return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+
+
+async def async_remove_entry(
+    hass: HomeAssistant, entry: FlameriteConfigEntry
+) -> None:
+    """Remove persisted data for a config entry."""
+
+    await Store(
+        hass, USAGE_STORAGE_VERSION, f"{USAGE_STORAGE_KEY}.{entry.entry_id}"
+    ).async_remove()
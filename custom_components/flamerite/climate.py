@@ -2,8 +2,12 @@
 
 from __future__ import annotations
 
+import asyncio
+import logging
+import time
 from collections.abc import Callable, Coroutine
 from dataclasses import dataclass
+from datetime import datetime
 from typing import Any
 
 from flamerite_bt.const import THERMOSTAT_MAX, THERMOSTAT_MIN, HeatMode
@@ -17,17 +21,46 @@ from homeassistant.components.climate.const import (
     FAN_LOW,
     FAN_OFF,
     ClimateEntityFeature,
+    HVACAction,
     HVACMode,
 )
-from homeassistant.const import ATTR_TEMPERATURE, UnitOfTemperature
-from homeassistant.core import HomeAssistant
+from homeassistant.const import (
+    ATTR_TEMPERATURE,
+    ATTR_UNIT_OF_MEASUREMENT,
+    STATE_UNAVAILABLE,
+    STATE_UNKNOWN,
+    UnitOfTemperature,
+)
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    Event,
+    EventStateChangedData,
+    HomeAssistant,
+    State,
+    callback,
+)
 from homeassistant.helpers.entity_platform import (  # noqa: RUF100
     AddConfigEntryEntitiesCallback,
 )
+from homeassistant.helpers.event import (
+    async_call_later,
+    async_track_state_change_event,
+)
+from homeassistant.helpers.restore_state import RestoreEntity
+from homeassistant.util.unit_conversion import TemperatureConverter
 
+from .const import (
+    CONF_HYSTERESIS,
+    CONF_MIN_CYCLE_DURATION,
+    CONF_TEMPERATURE_SENSOR,
+    DEFAULT_HYSTERESIS,
+    DEFAULT_MIN_CYCLE_DURATION,
+)
 from .coordinator import FlameriteConfigEntry, FlameriteDataUpdateCoordinator
 from .entity import FlameriteEntity
 
+_LOGGER = logging.getLogger(__name__)
+
 
 @dataclass(frozen=True, kw_only=True)
 class FlameriteClimateEntityDescription(ClimateEntityDescription):
@@ -43,11 +76,39 @@ class FlameriteClimateEntityDescription(ClimateEntityDescription):
     set_thermostat_fn: Callable[[Device, int], Coroutine[Any, int, None]]
 
 
-class FlameriteClimateEntity(FlameriteEntity, ClimateEntity):  # type: ignore
-    """A climate entity for controlling the fireplace heater."""
+class FlameriteClimateEntity(  # type: ignore
+    FlameriteEntity, ClimateEntity, RestoreEntity
+):
+    """A climate entity for controlling the fireplace heater.
+
+    When an external temperature sensor is configured, the entity reports
+    its value as the current temperature and runs a hysteresis controller
+    which switches heating on and off to keep the room at the target
+    temperature. The heat mode is only written to the device when a
+    transition is actually required.
+    """
 
     entity_description: FlameriteClimateEntityDescription  # type: ignore
 
+    _temperature_sensor: str | None
+    _hysteresis: float
+    _min_cycle_seconds: float
+    _control_lock: asyncio.Lock
+
+    # Whether the user asked the controller to maintain the target temperature.
+    _controller_enabled: bool = False
+    # The heat mode that the controller switches to when heating is required.
+    _heat_on_mode: HeatMode = HeatMode.LOW
+    # Monotonic timestamp of the last heating transition issued by the
+    # controller.
+    _last_transition: float | None = None
+    _cancel_cycle_check: CALLBACK_TYPE | None = None
+    # Whether a plain threshold controller would have flipped the heater
+    # since the last transition.
+    _flip_pending: bool = False
+    _controller_writes: int = 0
+    _saved_writes: int = 0
+
     def __init__(
         self,
         coordinator: FlameriteDataUpdateCoordinator,
@@ -71,9 +132,202 @@ class FlameriteClimateEntity(FlameriteEntity, ClimateEntity):  # type: ignore
         self._attr_max_temp = THERMOSTAT_MAX
         self._attr_target_temperature_step = 1.0
 
+        options = coordinator.config_entry.options
+        self._temperature_sensor = options.get(CONF_TEMPERATURE_SENSOR)
+        self._hysteresis = options.get(CONF_HYSTERESIS, DEFAULT_HYSTERESIS)
+        self._min_cycle_seconds = options.get(
+            CONF_MIN_CYCLE_DURATION, DEFAULT_MIN_CYCLE_DURATION
+        )
+        self._control_lock = asyncio.Lock()
+
+    async def async_added_to_hass(self) -> None:
+        """Start tracking the external temperature sensor."""
+        await super().async_added_to_hass()
+        if not self._temperature_sensor:
+            return
+
+        # Resume maintaining the target temperature if we were doing so
+        # before a restart.
+        if (last_state := await self.async_get_last_state()) is not None:
+            self._controller_enabled = last_state.state == HVACMode.HEAT
+        else:
+            self._controller_enabled = (
+                self.entity_description.get_heat_mode_fn(self.device)
+                is not HeatMode.OFF
+            )
+
+        self.async_on_remove(
+            async_track_state_change_event(
+                self.hass,
+                [self._temperature_sensor],
+                self._async_sensor_changed,
+            )
+        )
+        self.async_on_remove(self._async_cancel_cycle_check)
+        self._update_current_temperature(
+            self.hass.states.get(self._temperature_sensor)
+        )
+        self.hass.async_create_task(self._async_run_control())
+
+    async def _async_run_control(self) -> None:
+        """Run a control pass that was not requested by the user.
+
+        These passes run from event and timer callbacks, so device errors
+        are logged instead of being raised.
+        """
+        try:
+            await self._async_control_heating()
+        except Exception as ex:
+            _LOGGER.warning("Failed to update heating state: %s", ex)
+        self.async_write_ha_state()
+
+    async def _async_sensor_changed(
+        self, event: Event[EventStateChangedData]
+    ) -> None:
+        """Handle temperature changes reported by the external sensor."""
+        self._update_current_temperature(event.data["new_state"])
+        await self._async_run_control()
+
+    def _update_current_temperature(self, state: State | None) -> None:
+        """Update the current temperature from the external sensor state."""
+        self._attr_current_temperature = None
+        if state is None or state.state in (STATE_UNAVAILABLE, STATE_UNKNOWN):
+            return
+
+        try:
+            temperature = float(state.state)
+        except ValueError:
+            _LOGGER.warning(
+                "Ignoring non-numeric temperature from %s: %s",
+                self._temperature_sensor,
+                state.state,
+            )
+            return
+
+        unit = state.attributes.get(ATTR_UNIT_OF_MEASUREMENT)
+        if unit in TemperatureConverter.VALID_UNITS:
+            temperature = TemperatureConverter.convert(
+                temperature, unit, UnitOfTemperature.CELSIUS
+            )
+        self._attr_current_temperature = temperature
+
+    async def _async_control_heating(self, force: bool = False) -> None:
+        """Switch heating on or off based on the room temperature.
+
+        Transitions are rate-limited to one per minimum cycle duration
+        unless force is set. The controller never powers the fireplace on;
+        while it is off, heating is left alone.
+        """
+        async with self._control_lock:
+            if not self._controller_enabled:
+                return
+
+            is_on = self.entity_description.is_on_fn(self.device)
+            is_heating = is_on and (
+                self.entity_description.get_heat_mode_fn(self.device)
+                is not HeatMode.OFF
+            )
+            current = self._attr_current_temperature
+            target = self.target_temperature
+            if current is None or target is None:
+                # Never keep heating without feedback from the sensor.
+                if is_heating:
+                    await self._async_transition(
+                        HeatMode.OFF, "sensor_unavailable"
+                    )
+                return
+
+            if not is_on:
+                self._flip_pending = False
+                return
+
+            if is_heating:
+                should_heat = current < target + self._hysteresis
+            else:
+                should_heat = current <= target - self._hysteresis
+
+            if should_heat == is_heating:
+                # A plain threshold on the target temperature would have
+                # flipped the heater during this excursion. Count it as
+                # saved once the reading comes back without a transition.
+                if (current < target) != is_heating:
+                    self._flip_pending = True
+                elif self._flip_pending:
+                    self._flip_pending = False
+                    self._saved_writes += 1
+                return
+
+            if not force and self._last_transition is not None:
+                elapsed = time.monotonic() - self._last_transition
+                if elapsed < self._min_cycle_seconds:
+                    self._flip_pending = True
+                    self._async_schedule_cycle_check(
+                        self._min_cycle_seconds - elapsed
+                    )
+                    return
+
+            await self._async_transition(
+                self._heat_on_mode if should_heat else HeatMode.OFF,
+                "controller",
+            )
+
+    async def _async_transition(self, heat_mode: HeatMode, value: Any):
+        """Write a heating transition decided by the controller."""
+        await self._async_set_heat_mode(heat_mode, value)
+        self._controller_writes += 1
+        self._last_transition = time.monotonic()
+        self._flip_pending = False
+        self.coordinator.async_notify_command()
+
+    @callback
+    def _async_schedule_cycle_check(self, delay: float) -> None:
+        """Re-evaluate heating once the minimum cycle duration elapses."""
+        if self._cancel_cycle_check is not None:
+            return
+
+        async def _async_cycle_elapsed(_now: datetime) -> None:
+            self._cancel_cycle_check = None
+            await self._async_run_control()
+
+        self._cancel_cycle_check = async_call_later(
+            self.hass, delay, _async_cycle_elapsed
+        )
+
+    @callback
+    def _async_cancel_cycle_check(self) -> None:
+        """Cancel a pending cycle re-evaluation."""
+        if self._cancel_cycle_check is not None:
+            self._cancel_cycle_check()
+            self._cancel_cycle_check = None
+
+    async def _async_set_heat_mode(self, heat_mode: HeatMode, value: Any):
+        """Write the heat mode, powering on the device if required."""
+        async with self._traced_write(value):
+            # The device must be on to enable any heat mode
+            if heat_mode is not HeatMode.OFF and not (
+                self.entity_description.is_on_fn(self.device)
+            ):
+                await self.entity_description.turn_on_fn(self.device)
+
+            await self.entity_description.set_heat_mode_fn(
+                self.device, heat_mode
+            )
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Return the controller statistics."""
+        if not self._temperature_sensor:
+            return None
+        return {
+            "controller_writes": self._controller_writes,
+            "controller_saved_writes": self._saved_writes,
+        }
+
     @property
     def hvac_mode(self) -> HVACMode | None:  # type: ignore
         """Return currently active HVAC mode."""
+        if self._temperature_sensor:
+            return HVACMode.HEAT if self._controller_enabled else HVACMode.OFF
         if (
             self.entity_description.get_heat_mode_fn(self.device)
             is HeatMode.OFF
@@ -81,24 +335,48 @@ class FlameriteClimateEntity(FlameriteEntity, ClimateEntity):  # type: ignore
             return HVACMode.OFF
         return HVACMode.HEAT
 
+    @property
+    def hvac_action(self) -> HVACAction | None:  # type: ignore
+        """Return the current heating activity."""
+        if (
+            self.entity_description.get_heat_mode_fn(self.device)
+            is not HeatMode.OFF
+        ):
+            return HVACAction.HEATING
+        if self._controller_enabled:
+            return HVACAction.IDLE
+        return HVACAction.OFF
+
     async def async_set_hvac_mode(self, hvac_mode: HVACMode) -> None:
         """Set the current HVAC mode."""
-        heat_mode = self.entity_description.get_heat_mode_fn(self.device)
+        if self._temperature_sensor:
+            self._controller_enabled = hvac_mode is HVACMode.HEAT
+            if self._controller_enabled:
+                # The controller only heats while the fireplace is on, so
+                # power it on at the user's request.
+                if not self.entity_description.is_on_fn(self.device):
+                    async with self._traced_write(hvac_mode):
+                        await self.entity_description.turn_on_fn(self.device)
+                    self.coordinator.async_notify_command()
+                await self._async_control_heating(force=True)
+            else:
+                self._flip_pending = False
+                self._async_cancel_cycle_check()
+                await self._async_set_heat_mode(HeatMode.OFF, hvac_mode)
+                self.coordinator.async_notify_command()
+            self.async_write_ha_state()
+            return
 
+        heat_mode = HeatMode.OFF
         if hvac_mode is HVACMode.HEAT:
-            # The device must be on to enable any heat mode
-            if not self.entity_description.is_on_fn(self.device):
-                await self.entity_description.turn_on_fn(self.device)
-
             # If heating is curently off, switch to low heat mode; otherwise
             # retain existing heat mode.
+            heat_mode = self.entity_description.get_heat_mode_fn(self.device)
             if heat_mode is HeatMode.OFF:
                 heat_mode = HeatMode.LOW
-        else:
-            heat_mode = HeatMode.OFF
 
-        await self.entity_description.set_heat_mode_fn(self.device, heat_mode)
-        await self.coordinator.async_request_refresh()
+        await self._async_set_heat_mode(heat_mode, hvac_mode)
+        self.coordinator.async_notify_command()
 
     @property
     def target_temperature(self) -> float | None:  # type: ignore
@@ -108,10 +386,12 @@ class FlameriteClimateEntity(FlameriteEntity, ClimateEntity):  # type: ignore
     async def async_set_temperature(self, **kwargs):
         """Set the thermostat setting."""
         temperature = kwargs[ATTR_TEMPERATURE]
-        await self.entity_description.set_thermostat_fn(
-            self.device, int(temperature)
-        )
-        await self.coordinator.async_request_refresh()
+        async with self._traced_write(temperature):
+            await self.entity_description.set_thermostat_fn(
+                self.device, int(temperature)
+            )
+        await self._async_control_heating()
+        self.coordinator.async_notify_command()
 
     @property
     def fan_mode(self) -> str | None:  # type: ignore
@@ -126,16 +406,28 @@ class FlameriteClimateEntity(FlameriteEntity, ClimateEntity):  # type: ignore
     async def async_set_fan_mode(self, fan_mode: str):
         """Set new target fan mode."""
         heat_mode = HeatMode.OFF
-
         if fan_mode in [FAN_LOW, FAN_HIGH]:
-            # The device must be on to adjust the fan.
-            if not self.entity_description.is_on_fn(self.device):
-                await self.entity_description.turn_on_fn(self.device)
-
             heat_mode = HeatMode.LOW if fan_mode == FAN_LOW else HeatMode.HIGH
 
-        await self.entity_description.set_heat_mode_fn(self.device, heat_mode)
-        await self.coordinator.async_request_refresh()
+        if self._temperature_sensor:
+            # Heating is owned by the controller: OFF disables it, while a
+            # heat level enables it and is used whenever heating is needed.
+            if heat_mode is HeatMode.OFF:
+                await self.async_set_hvac_mode(HVACMode.OFF)
+                return
+
+            self._heat_on_mode = heat_mode
+            if (
+                self.entity_description.get_heat_mode_fn(self.device)
+                is not HeatMode.OFF
+            ):
+                await self._async_set_heat_mode(heat_mode, fan_mode)
+                self.coordinator.async_notify_command()
+            await self.async_set_hvac_mode(HVACMode.HEAT)
+            return
+
+        await self._async_set_heat_mode(heat_mode, fan_mode)
+        self.coordinator.async_notify_command()
 
 
 CLIMATE_DESCRS = [
@@ -8,11 +8,60 @@ from typing import Any
 import voluptuous as vol
 from flamerite_bt.device import Device
 from homeassistant.components import bluetooth
-from homeassistant.config_entries import ConfigFlow, ConfigFlowResult
+from homeassistant.components.sensor import SensorDeviceClass
+from homeassistant.config_entries import (
+    ConfigEntry,
+    ConfigFlow,
+    ConfigFlowResult,
+    OptionsFlow,
+)
 from homeassistant.const import CONF_ADDRESS
+from homeassistant.core import callback
 from homeassistant.helpers.device_registry import format_mac
-
-from .const import DOMAIN
+from homeassistant.helpers.selector import (
+    EntitySelector,
+    EntitySelectorConfig,
+)
+
+from .const import (
+    CONF_HIGH_HEAT_POWER,
+    CONF_HYSTERESIS,
+    CONF_LOW_HEAT_POWER,
+    CONF_MIN_CYCLE_DURATION,
+    CONF_TEMPERATURE_SENSOR,
+    DEFAULT_HIGH_HEAT_POWER,
+    DEFAULT_HYSTERESIS,
+    DEFAULT_LOW_HEAT_POWER,
+    DEFAULT_MIN_CYCLE_DURATION,
+    DOMAIN,
+    MAX_HEAT_POWER,
+    MAX_HYSTERESIS,
+    MAX_MIN_CYCLE_DURATION,
+)
+
+OPTIONS_SCHEMA = vol.Schema(
+    {
+        vol.Required(
+            CONF_LOW_HEAT_POWER, default=DEFAULT_LOW_HEAT_POWER
+        ): vol.All(vol.Coerce(int), vol.Range(min=0, max=MAX_HEAT_POWER)),
+        vol.Required(
+            CONF_HIGH_HEAT_POWER, default=DEFAULT_HIGH_HEAT_POWER
+        ): vol.All(vol.Coerce(int), vol.Range(min=0, max=MAX_HEAT_POWER)),
+        vol.Optional(CONF_TEMPERATURE_SENSOR): EntitySelector(
+            EntitySelectorConfig(
+                domain="sensor", device_class=SensorDeviceClass.TEMPERATURE
+            )
+        ),
+        vol.Required(CONF_HYSTERESIS, default=DEFAULT_HYSTERESIS): vol.All(
+            vol.Coerce(float), vol.Range(min=0, max=MAX_HYSTERESIS)
+        ),
+        vol.Required(
+            CONF_MIN_CYCLE_DURATION, default=DEFAULT_MIN_CYCLE_DURATION
+        ): vol.All(
+            vol.Coerce(int), vol.Range(min=0, max=MAX_MIN_CYCLE_DURATION)
+        ),
+    }
+)
 
 
 class FlameriteConfigFlow(ConfigFlow, domain=DOMAIN):
@@ -26,6 +75,12 @@ class FlameriteConfigFlow(ConfigFlow, domain=DOMAIN):
         self._discovered_address: str
         self._pairing_address: str
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(config_entry: ConfigEntry) -> OptionsFlow:
+        """Return the options flow handler."""
+        return FlameriteOptionsFlow()
+
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
     ) -> ConfigFlowResult:
@@ -156,3 +211,21 @@ class FlameriteConfigFlow(ConfigFlow, domain=DOMAIN):
                 CONF_ADDRESS: self._pairing_address,
             },
         )
+
+
+class FlameriteOptionsFlow(OptionsFlow):
+    """Handle the options for a Flamerite Fireplace."""
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Configure energy estimation and room temperature control."""
+        if user_input is not None:
+            return self.async_create_entry(data=user_input)
+
+        return self.async_show_form(
+            step_id="init",
+            data_schema=self.add_suggested_values_to_schema(
+                OPTIONS_SCHEMA, self.config_entry.options
+            ),
+        )
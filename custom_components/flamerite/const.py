@@ -7,9 +7,39 @@ DEFAULT_NAME = "Flamerite"
 DEVICE_SERVICE_UUID = "0000fff0-0000-1000-8000-00805f9b34fb"
 UPDATE_INTERVAL_MS = 5000
 
+# Heater power draw (in watts) used to estimate energy consumption.
+CONF_LOW_HEAT_POWER = "low_heat_power"
+CONF_HIGH_HEAT_POWER = "high_heat_power"
+DEFAULT_LOW_HEAT_POWER = 1000
+DEFAULT_HIGH_HEAT_POWER = 2000
+MAX_HEAT_POWER = 5000
+
+# Optional external room temperature sensor used by the climate entity to
+# switch heating on and off around the target temperature.
+CONF_TEMPERATURE_SENSOR = "temperature_sensor"
+CONF_HYSTERESIS = "hysteresis"
+CONF_MIN_CYCLE_DURATION = "min_cycle_duration"
+DEFAULT_HYSTERESIS = 0.5
+DEFAULT_MIN_CYCLE_DURATION = 300
+MAX_HYSTERESIS = 5.0
+MAX_MIN_CYCLE_DURATION = 3600
+
+# Persistence of the accumulated usage totals.
+USAGE_STORAGE_KEY = f"{DOMAIN}.usage"
+USAGE_STORAGE_VERSION = 1
+USAGE_SAVE_DELAY_SECONDS = 60
+
+# Intervals between two consecutive state samples that exceed this value
+# (e.g. because the device was unreachable) are not counted towards usage.
+USAGE_MAX_SAMPLE_GAP_SECONDS = 60
+
+# Number of events kept in the per-device trace ring buffer.
+TRACE_BUFFER_SIZE = 2000
+
 PLATFORMS = [
     Platform.SWITCH,
     Platform.CLIMATE,
     Platform.SELECT,
     Platform.NUMBER,
+    Platform.SENSOR,
 ]
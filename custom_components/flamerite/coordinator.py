@@ -1,14 +1,32 @@
 """Coordinator for the Flamerite Fireplace integration."""
 
 import logging
+import time
 from datetime import timedelta
+from typing import Any
 
+from flamerite_bt.const import HeatMode
 from flamerite_bt.device import Device
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
-from .const import DEFAULT_NAME, UPDATE_INTERVAL_MS
+from .const import (
+    CONF_HIGH_HEAT_POWER,
+    CONF_LOW_HEAT_POWER,
+    DEFAULT_HIGH_HEAT_POWER,
+    DEFAULT_LOW_HEAT_POWER,
+    DEFAULT_NAME,
+    TRACE_BUFFER_SIZE,
+    UPDATE_INTERVAL_MS,
+    USAGE_MAX_SAMPLE_GAP_SECONDS,
+    USAGE_SAVE_DELAY_SECONDS,
+    USAGE_STORAGE_KEY,
+    USAGE_STORAGE_VERSION,
+)
+from .trace import FlameriteTrace
+from .usage import FlameriteUsage
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -20,6 +38,14 @@ class FlameriteDataUpdateCoordinator(DataUpdateCoordinator[Device]):
 
     config_entry: FlameriteConfigEntry
     _device: Device
+    _usage: FlameriteUsage
+    _usage_store: Store[dict[str, Any]]
+    _trace: FlameriteTrace
+    _was_connected: bool | None = None
+
+    # Monotonic timestamp, power state and heat mode of the last snapshot
+    # that was accounted for in the usage totals.
+    _usage_sample: tuple[float, bool, HeatMode] | None = None
 
     def __init__(
         self,
@@ -36,13 +62,103 @@ class FlameriteDataUpdateCoordinator(DataUpdateCoordinator[Device]):
             update_interval=timedelta(milliseconds=UPDATE_INTERVAL_MS),
         )
         self._device = device
+        self._usage = FlameriteUsage()
+        self._usage_store = Store(
+            hass,
+            USAGE_STORAGE_VERSION,
+            f"{USAGE_STORAGE_KEY}.{config_entry.entry_id}",
+        )
+        self._trace = FlameriteTrace(TRACE_BUFFER_SIZE)
 
     async def _async_update_data(self):
         """Update the device state."""
-        await self._device.query_state()
+        self._trace.record("poll_start")
+        try:
+            with self._trace.timed("poll_end"):
+                await self._device.query_state()
+        finally:
+            # The device raises when the link is down, so record the
+            # connection state regardless of the outcome.
+            self._update_availability()
+        self._update_usage()
         return self._device
 
+    async def async_request_refresh(self) -> None:
+        """Request a debounced refresh of the device state."""
+        self._trace.record("refresh_request")
+        await super().async_request_refresh()
+
+    @callback
+    def async_notify_command(self) -> None:
+        """Push the device state to listeners after a command was sent.
+
+        Commands are not read back: flamerite_bt applies every change to its
+        local state as soon as the command is written and the device can
+        only report its full state, so confirmation is deferred to the next
+        scheduled poll.
+        """
+        self._trace.record("command", confirmation="deferred")
+        self.async_update_listeners()
+
+    def _update_availability(self) -> None:
+        """Record changes to the device connection state."""
+        is_connected = self._device.is_connected
+        if is_connected != self._was_connected:
+            self._trace.record("availability", connected=is_connected)
+            self._was_connected = is_connected
+
+    async def async_load_usage(self) -> None:
+        """Restore the usage totals persisted by a previous run."""
+        if (data := await self._usage_store.async_load()) is not None:
+            self._usage = FlameriteUsage.from_dict(data)
+
+    async def async_save_usage(self) -> None:
+        """Persist the current usage totals."""
+        await self._usage_store.async_save(self._usage.as_dict())
+
+    def _update_usage(self) -> None:
+        """Integrate the time elapsed since the previous snapshot."""
+        now = time.monotonic()
+        prev_sample = self._usage_sample
+        self._usage_sample = (
+            (now, self._device.is_powered_on, self._device.heat_mode)
+            if self._device.is_connected
+            else None
+        )
+        if prev_sample is None:
+            return
+
+        # The previous state is assumed to have held until now. Skip
+        # intervals where we lost track of the device for too long.
+        prev_time, prev_is_powered_on, prev_heat_mode = prev_sample
+        elapsed = now - prev_time
+        if elapsed > USAGE_MAX_SAMPLE_GAP_SECONDS:
+            return
+
+        options = self.config_entry.options
+        self._usage.accumulate(
+            elapsed,
+            prev_is_powered_on,
+            prev_heat_mode,
+            options.get(CONF_LOW_HEAT_POWER, DEFAULT_LOW_HEAT_POWER),
+            options.get(CONF_HIGH_HEAT_POWER, DEFAULT_HIGH_HEAT_POWER),
+        )
+        if prev_is_powered_on:
+            self._usage_store.async_delay_save(
+                self._usage.as_dict, USAGE_SAVE_DELAY_SECONDS
+            )
+
     @property
     def device(self) -> Device:
         """Return underlying device reference."""
         return self._device
+
+    @property
+    def trace(self) -> FlameriteTrace:
+        """Return the device event trace."""
+        return self._trace
+
+    @property
+    def usage(self) -> FlameriteUsage:
+        """Return the accumulated usage totals."""
+        return self._usage
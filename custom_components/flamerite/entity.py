@@ -1,5 +1,9 @@
 """Base class definition for Flamerite entities."""
 
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Any
+
 from flamerite_bt.device import Device
 from homeassistant.core import callback
 from homeassistant.helpers.device_registry import DeviceInfo
@@ -41,3 +45,19 @@ class FlameriteEntity(CoordinatorEntity[FlameriteDataUpdateCoordinator]):
         """Handle updated data from the coordinator."""
         self._attr_available = self.device.is_connected
         self.async_write_ha_state()
+
+    @asynccontextmanager
+    async def _traced_write(self, value: Any) -> AsyncIterator[None]:
+        """Trace a write of the given value to the device.
+
+        flamerite_bt updates its local state before the command is sent, so
+        the device state is re-read if the write fails.
+        """
+        try:
+            with self.coordinator.trace.timed(
+                "write", entity=self.entity_description.key, value=value
+            ):
+                yield
+        except Exception:
+            await self.coordinator.async_request_refresh()
+            raise
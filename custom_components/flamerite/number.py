@@ -51,8 +51,9 @@ class FlameriteNumberEntity(FlameriteEntity, NumberEntity):  # type: ignore
 
     async def async_set_native_value(self, value: float) -> None:
         """Change the brightness value."""
-        await self.entity_description.set_value_fn(self.device, int(value))
-        await self.coordinator.async_request_refresh()
+        async with self._traced_write(int(value)):
+            await self.entity_description.set_value_fn(self.device, int(value))
+        self.coordinator.async_notify_command()
 
 
 Number_DESCRS = [
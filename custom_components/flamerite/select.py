@@ -53,8 +53,9 @@ class FlameriteSelectEntity(FlameriteEntity, SelectEntity):  # type: ignore
     async def async_select_option(self, option: str) -> None:
         """Change the selected color."""
         color = COLOR_NAME_MAP[option]
-        await self.entity_description.set_value_fn(self.device, color)
-        await self.coordinator.async_request_refresh()
+        async with self._traced_write(color.name):
+            await self.entity_description.set_value_fn(self.device, color)
+        self.coordinator.async_notify_command()
 
 
 SELECT_DESCRS = [
@@ -0,0 +1,117 @@
+"""Usage sensor support for Flamerite devices."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntity,
+    SensorEntityDescription,
+    SensorStateClass,
+)
+from homeassistant.const import UnitOfEnergy, UnitOfTime
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity_platform import (  # noqa: RUF100
+    AddConfigEntryEntitiesCallback,
+)
+
+from .coordinator import FlameriteConfigEntry, FlameriteDataUpdateCoordinator
+from .entity import FlameriteEntity
+from .usage import SECONDS_PER_HOUR, FlameriteUsage
+
+
+@dataclass(frozen=True, kw_only=True)
+class FlameriteSensorEntityDescription(SensorEntityDescription):
+    """Describes a Flamerite sensor entity.
+
+    Values are rounded so that the state only changes (and is recorded) once
+    per 0.01 h or 0.01 kWh rather than on every poll.
+    """
+
+    value_fn: Callable[[FlameriteUsage], float]
+
+
+class FlameriteSensorEntity(FlameriteEntity, SensorEntity):  # type: ignore
+    """A sensor entity reporting accumulated fireplace usage."""
+
+    entity_description: FlameriteSensorEntityDescription
+
+    def __init__(
+        self,
+        coordinator: FlameriteDataUpdateCoordinator,
+        description: FlameriteSensorEntityDescription,
+    ):
+        """Initialize usage sensor entity."""
+        super().__init__(coordinator, description)
+        self.entity_description = description  # type: ignore
+
+    @property
+    def native_value(self) -> float | None:  # type: ignore
+        """Return the accumulated usage value."""
+        return self.entity_description.value_fn(self.coordinator.usage)
+
+
+SENSOR_DESCRS = [
+    FlameriteSensorEntityDescription(
+        key="powered_on_time",
+        translation_key="powered_on_time",
+        icon="mdi:timer-outline",
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        native_unit_of_measurement=UnitOfTime.HOURS,
+        suggested_display_precision=2,
+        value_fn=lambda usage: round(
+            usage.powered_on_seconds / SECONDS_PER_HOUR, 2
+        ),
+    ),
+    FlameriteSensorEntityDescription(
+        key="low_heat_time",
+        translation_key="low_heat_time",
+        icon="mdi:radiator",
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        native_unit_of_measurement=UnitOfTime.HOURS,
+        suggested_display_precision=2,
+        value_fn=lambda usage: round(
+            usage.low_heat_seconds / SECONDS_PER_HOUR, 2
+        ),
+    ),
+    FlameriteSensorEntityDescription(
+        key="high_heat_time",
+        translation_key="high_heat_time",
+        icon="mdi:radiator",
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        native_unit_of_measurement=UnitOfTime.HOURS,
+        suggested_display_precision=2,
+        value_fn=lambda usage: round(
+            usage.high_heat_seconds / SECONDS_PER_HOUR, 2
+        ),
+    ),
+    FlameriteSensorEntityDescription(
+        key="heater_energy",
+        translation_key="heater_energy",
+        device_class=SensorDeviceClass.ENERGY,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
+        suggested_display_precision=2,
+        value_fn=lambda usage: round(usage.energy_kwh, 2),
+    ),
+]
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    config_entry: FlameriteConfigEntry,
+    async_add_entities: AddConfigEntryEntitiesCallback,
+) -> None:
+    """Set up the sensor platform."""
+
+    coordinator = config_entry.runtime_data
+    entities = [
+        FlameriteSensorEntity(coordinator, description)
+        for description in SENSOR_DESCRS
+    ]
+    async_add_entities(entities)
@@ -0,0 +1,69 @@
+"""Services for the Flamerite Fireplace integration."""
+
+from __future__ import annotations
+
+import voluptuous as vol
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+)
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import config_validation as cv
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN
+from .coordinator import FlameriteConfigEntry
+
+ATTR_CONFIG_ENTRY_ID = "config_entry_id"
+
+SERVICE_DUMP_TRACE = "dump_trace"
+SERVICE_DUMP_TRACE_SCHEMA = vol.Schema(
+    {vol.Optional(ATTR_CONFIG_ENTRY_ID): cv.string}
+)
+
+
+def _get_loaded_entries(call: ServiceCall) -> list[FlameriteConfigEntry]:
+    """Return the loaded config entries targeted by a service call."""
+    entries: list[FlameriteConfigEntry] = [
+        entry
+        for entry in call.hass.config_entries.async_entries(DOMAIN)
+        if entry.state is ConfigEntryState.LOADED
+    ]
+
+    if (entry_id := call.data.get(ATTR_CONFIG_ENTRY_ID)) is not None:
+        entries = [entry for entry in entries if entry.entry_id == entry_id]
+        if not entries:
+            raise ServiceValidationError(
+                f"No loaded Flamerite device for config entry: {entry_id}"
+            )
+    return entries
+
+
+async def _async_dump_trace(call: ServiceCall) -> ServiceResponse:
+    """Write the trace buffer of each targeted device to a JSONL file."""
+    hass = call.hass
+    timestamp = dt_util.utcnow().strftime("%Y%m%d%H%M%S")
+
+    files: dict[str, str] = {}
+    for entry in _get_loaded_entries(call):
+        path = hass.config.path(
+            f"{DOMAIN}_trace_{entry.entry_id}_{timestamp}.jsonl"
+        )
+        await hass.async_add_executor_job(entry.runtime_data.trace.dump, path)
+        files[entry.entry_id] = path
+
+    return {"files": files}
+
+
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the integration services."""
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_DUMP_TRACE,
+        _async_dump_trace,
+        schema=SERVICE_DUMP_TRACE_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
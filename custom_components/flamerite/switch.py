@@ -61,9 +61,10 @@ class FlameriteSwitchEntity(FlameriteEntity, SwitchEntity):  # type: ignore
 
     async def async_turn_on(self, **kwargs):
         """Turn the fireplace on."""
-        await self.entity_description.turn_on_fn(self.device)
+        async with self._traced_write(True):
+            await self.entity_description.turn_on_fn(self.device)
         self._off_delay_until = None
-        await self.coordinator.async_request_refresh()
+        self.coordinator.async_notify_command()
 
     async def async_turn_off(self, **kwargs):
         """Turn the fireplace off."""
@@ -72,7 +73,8 @@ class FlameriteSwitchEntity(FlameriteEntity, SwitchEntity):  # type: ignore
         # and this causes the switch state to jump from off -> on -> off. To
         # avoid this we force the reported device state as off for the
         # transition duration.
-        await self.entity_description.turn_off_fn(self.device)
+        async with self._traced_write(False):
+            await self.entity_description.turn_off_fn(self.device)
         self._off_delay_until = time.monotonic() + self._off_delay_seconds
         self._attr_is_on = False
         self.async_write_ha_state()
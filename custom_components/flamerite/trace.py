@@ -0,0 +1,67 @@
+"""Bounded in-memory event trace for Flamerite devices."""
+
+from __future__ import annotations
+
+import json
+import time
+from collections import deque
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import UTC, datetime
+from typing import Any
+
+
+class FlameriteTrace:
+    """A fixed-size ring buffer of structured device events.
+
+    Events are stored as raw tuples and only serialized when the trace is
+    dumped, which keeps the cost of recording to a single append.
+    """
+
+    _events: deque[tuple[float, str, dict[str, Any]]]
+
+    def __init__(self, size: int) -> None:
+        """Initialize the trace buffer."""
+        self._events = deque(maxlen=size)
+
+    def record(self, event: str, **data: Any) -> None:
+        """Record an event."""
+        self._events.append((time.time(), event, data))
+
+    @contextmanager
+    def timed(self, event: str, **data: Any) -> Iterator[None]:
+        """Record an event along with the duration of the wrapped block."""
+        start = time.monotonic()
+        try:
+            yield
+        except BaseException as ex:
+            data["error"] = repr(ex)
+            raise
+        finally:
+            data["duration_ms"] = round((time.monotonic() - start) * 1000, 3)
+            self.record(event, **data)
+
+    def dump(self, path: str) -> int:
+        """Write the buffered events to a JSONL file and return their count.
+
+        This performs blocking I/O and must be run in the executor.
+        """
+        events = list(self._events)
+        with open(path, "w", encoding="utf-8") as f:
+            for ts, event, data in events:
+                f.write(
+                    json.dumps(
+                        {
+                            "ts": datetime.fromtimestamp(ts, UTC).isoformat(),
+                            "event": event,
+                            **data,
+                        },
+                        default=str,
+                    )
+                )
+                f.write("\n")
+        return len(events)
+
+    def __len__(self) -> int:
+        """Return the number of buffered events."""
+        return len(self._events)
@@ -0,0 +1,59 @@
+"""Heater usage accounting for Flamerite devices."""
+
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass, fields
+from typing import Any
+
+from flamerite_bt.const import HeatMode
+
+SECONDS_PER_HOUR = 3600.0
+
+
+@dataclass
+class FlameriteUsage:
+    """Cumulative runtime and estimated energy totals for a fireplace."""
+
+    powered_on_seconds: float = 0.0
+    low_heat_seconds: float = 0.0
+    high_heat_seconds: float = 0.0
+    energy_kwh: float = 0.0
+
+    def accumulate(
+        self,
+        seconds: float,
+        is_powered_on: bool,
+        heat_mode: HeatMode,
+        low_heat_watts: float,
+        high_heat_watts: float,
+    ) -> None:
+        """Attribute an interval spent in the given state to the totals."""
+        if not is_powered_on:
+            return
+
+        self.powered_on_seconds += seconds
+
+        watts = 0.0
+        if heat_mode is HeatMode.LOW:
+            self.low_heat_seconds += seconds
+            watts = low_heat_watts
+        elif heat_mode is HeatMode.HIGH:
+            self.high_heat_seconds += seconds
+            watts = high_heat_watts
+
+        self.energy_kwh += watts * seconds / SECONDS_PER_HOUR / 1000.0
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a serializable representation of the totals."""
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> FlameriteUsage:
+        """Restore totals from their serialized representation."""
+        return cls(
+            **{
+                field.name: float(data[field.name])
+                for field in fields(cls)
+                if field.name in data
+            }
+        )